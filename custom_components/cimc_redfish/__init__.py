@@ -9,8 +9,11 @@ from __future__ import annotations
 from datetime import timedelta
 import logging
 
+import aiohttp
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
@@ -25,7 +28,7 @@ from .const import (
     DOMAIN,
     PLATFORMS,
 )
-from .coordinator import CimcRedfishClient
+from .coordinator import CimcRedfishClient, async_get_ssl_context, create_session
 
 type HassConfigEntry = ConfigEntry
 
@@ -33,6 +36,39 @@ type HassConfigEntry = ConfigEntry
 _LOGGER = logging.getLogger(__name__)
 
 
+def _acquire_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the HTTP session shared by all CIMC entries, taking a reference."""
+    domain_data = hass.data[DOMAIN]
+    session = domain_data.get("_session")
+    if session is None or session.closed:
+        session = domain_data["_session"] = create_session()
+        domain_data["_session_refs"] = 0
+
+        async def _async_close_session(_event: Event) -> None:
+            # Config entries aren't unloaded on shutdown; close it here.
+            domain_data.pop("_session_unsub", None)
+            await session.close()
+
+        domain_data["_session_unsub"] = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close_session
+        )
+    domain_data["_session_refs"] += 1
+    return session
+
+
+async def _async_release_session(hass: HomeAssistant) -> None:
+    """Drop a reference to the shared session, closing it after the last one."""
+    domain_data = hass.data[DOMAIN]
+    domain_data["_session_refs"] -= 1
+    if domain_data["_session_refs"] <= 0:
+        domain_data.pop("_session_refs", None)
+        if unsub := domain_data.pop("_session_unsub", None):
+            unsub()
+        session = domain_data.pop("_session", None)
+        if session is not None:
+            await session.close()
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: HassConfigEntry) -> bool:
     """Set up CIMC Redfish from a config entry."""
     hass.data.setdefault(DOMAIN, {})
@@ -43,40 +79,47 @@ async def async_setup_entry(hass: HomeAssistant, entry: HassConfigEntry) -> bool
     verify_ssl = entry.data.get(CONF_VERIFY_SSL, False)
     tls_min = entry.data.get(CONF_TLS_MIN, "1.0")
 
-    client = CimcRedfishClient(
-        host=host,
-        username=username,
-        password=password,
-        verify_ssl=verify_ssl,
-        tls_min=tls_min,
-    )
-
-    async def _async_update():
-        return await hass.async_add_executor_job(client.fetch_all)
-
-    interval = timedelta(
-        seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-    )
-    coordinator = DataUpdateCoordinator(
-        hass,
-        logger=_LOGGER,
-        name=f"CIMC Redfish ({host})",
-        update_method=_async_update,
-        update_interval=interval,
-    )
-
-    # Initial fetch to validate connection & seed data
+    session = _acquire_session(hass)
     try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as exc:
-        raise ConfigEntryNotReady(str(exc)) from exc
+        client = CimcRedfishClient(
+            host=host,
+            username=username,
+            password=password,
+            ssl_context=await async_get_ssl_context(hass, verify_ssl, tls_min),
+            session=session,
+        )
 
-    hass.data[DOMAIN][entry.entry_id] = {
-        "client": client,
-        "coordinator": coordinator,
-    }
+        interval = timedelta(
+            seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        coordinator = DataUpdateCoordinator(
+            hass,
+            logger=_LOGGER,
+            name=f"CIMC Redfish ({host})",
+            update_method=client.fetch_all,
+            update_interval=interval,
+            # Skip listener callbacks when a poll returns an identical snapshot
+            always_update=False,
+        )
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        # Discover chassis/device info once, then fetch to validate & seed data
+        try:
+            await client.async_setup()
+            await coordinator.async_config_entry_first_refresh()
+        except Exception as exc:
+            raise ConfigEntryNotReady(str(exc)) from exc
+
+        hass.data[DOMAIN][entry.entry_id] = {
+            "client": client,
+            "coordinator": coordinator,
+        }
+
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except Exception:
+        # Any failure after acquiring the session must drop our reference
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await _async_release_session(hass)
+        raise
 
     async def _update_listener(updated_entry: HassConfigEntry):
         # just update the interval; credentials rarely change outside reauth
@@ -93,5 +136,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: HassConfigEntry) -> boo
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        if hass.data[DOMAIN].pop(entry.entry_id, None):
+            await _async_release_session(hass)
     return unload_ok
@@ -7,10 +7,10 @@ during setup.
 
 from __future__ import annotations
 
-import contextlib
+import asyncio
 import logging
 
-import requests
+import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -29,7 +29,7 @@ from .const import (
     DEFAULT_VERIFY_SSL,
     DOMAIN,
 )
-from .coordinator import CimcRedfishClient
+from .coordinator import CimcRedfishClient, async_get_ssl_context
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,6 +53,22 @@ OPTIONS_SCHEMA = vol.Schema(
     }
 )
 
+# Redfish HTTP status -> config flow error key; 404/405 likely means no
+# Redfish on this firmware/box.
+_HTTP_CODE_TO_ERR = {
+    401: "invalid_auth",
+    403: "forbidden",
+    404: "not_supported",
+    405: "not_supported",
+}
+
+# Checked in order: ClientSSLError is itself a ClientConnectionError.
+_EXC_TO_ERR = {
+    (aiohttp.ClientSSLError,): "ssl_error",
+    (asyncio.TimeoutError, aiohttp.ServerTimeoutError): "timeout",
+    (aiohttp.ClientConnectionError,): "cannot_connect",
+}
+
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle the initial CIMC Redfish config flow."""
@@ -86,50 +102,33 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             host=data[CONF_HOST],
             username=data[CONF_USERNAME],
             password=data[CONF_PASSWORD],
-            verify_ssl=data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
-            tls_min=data.get(CONF_TLS_MIN, DEFAULT_TLS_MIN),
+            ssl_context=await async_get_ssl_context(
+                hass,
+                data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
+                data.get(CONF_TLS_MIN, DEFAULT_TLS_MIN),
+            ),
         )
         try:
-            res = await hass.async_add_executor_job(client.fetch_fans)
+            res = await client.fetch_fans()
             if not isinstance(res, dict) or "fans" not in res:
                 _LOGGER.debug("Unexpected response during validation: %r", res)
                 return False, "cannot_connect"
             return True, None  # noqa: TRY300
 
-        except requests.exceptions.HTTPError as e:
-            code = e.response.status_code if e.response is not None else None
-            body = ""
-            with contextlib.suppress(Exception):
-                body = e.response.text[:300] if e.response is not None else ""
-            _LOGGER.warning(
-                "HTTP error talking to CIMC: %s %s | body=%r", code, e, body
-            )
-
-            if code == 401:
-                return False, "invalid_auth"
-            if code in (403,):
-                return False, "forbidden"
-            if code in (404, 405):
-                # Likely no Redfish on this firmware/box
-                return False, "not_supported"
-            return False, "cannot_connect"
-
-        except requests.exceptions.SSLError as e:
-            _LOGGER.warning("TLS/SSL error talking to CIMC: %s", e)
-            return False, "ssl_error"
-
-        except requests.exceptions.ConnectTimeout as e:
-            _LOGGER.warning("Timeout talking to CIMC: %s", e)
-            return False, "timeout"
-
-        except requests.exceptions.ConnectionError as e:
-            _LOGGER.warning("Connection error to CIMC: %s", e)
-            return False, "cannot_connect"
-
-        except Exception:
+        except Exception as e:
+            if isinstance(e, aiohttp.ClientResponseError):
+                _LOGGER.warning("HTTP error talking to CIMC: %s %s", e.status, e.message)
+                return False, _HTTP_CODE_TO_ERR.get(e.status, "cannot_connect")
+            for exc_types, err in _EXC_TO_ERR.items():
+                if isinstance(e, exc_types):
+                    _LOGGER.warning("Error talking to CIMC (%s): %s", err, e)
+                    return False, err
             _LOGGER.exception("Unexpected error during CIMC validation")
             return False, "unknown"
 
+        finally:
+            await client.async_close()
+
     @staticmethod
     def async_get_options_flow(config_entry):
         """Return the options flow handler for this integration."""
@@ -1,177 +1,339 @@
-"""Legacy-TLS session adapter and minimal Redfish client for Cisco CIMC.
+"""Legacy-TLS SSL context and minimal async Redfish client for Cisco CIMC.
 
 This module provides:
-- `_LegacyTLSAdapter`: a `requests` adapter that relaxes OpenSSL 3 defaults so
-  we can talk to older CIMC images (weak ciphers / TLS <= 1.2).
-- `CimcRedfishClient`: a very small synchronous Redfish client used by the
-  coordinator to fetch fan telemetry and basic device info.
+- `_build_ssl_context`: builds an `ssl.SSLContext` that relaxes OpenSSL 3
+  defaults so we can talk to older CIMC images (weak ciphers / TLS <= 1.2).
+- `async_get_ssl_context`: builds that context in the executor, since loading
+  the CA bundle is blocking I/O.
+- `create_session`: builds the keep-alive `aiohttp.ClientSession` shared by
+  every configured CIMC.
+- `CimcRedfishClient`: a very small asyncio Redfish client (aiohttp) used by
+  the coordinator to fetch fan telemetry and basic device info.
 """
 
+import asyncio
 from contextlib import suppress
+import functools
 import ssl
+import sys
 from typing import Any
 
-import requests
-from requests.adapters import HTTPAdapter
-import urllib3
-from urllib3.exceptions import InsecureRequestWarning
+import aiohttp
+import certifi
+import orjson
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import DEFAULT_SCAN_INTERVAL
+
+_TIMEOUT = aiohttp.ClientTimeout(total=10)
+_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip",
+    "Connection": "keep-alive",
+}
+
+# (payload key, Redfish key) pairs shared by fans, temperatures and rails
+_THRESH_KEYS = (
+    ("lower_noncrit", "LowerThresholdNonCritical"),
+    ("lower_crit", "LowerThresholdCritical"),
+    ("upper_noncrit", "UpperThresholdNonCritical"),
+    ("upper_crit", "UpperThresholdCritical"),
+)
+
+# (by_key kind, payload section) pairs indexed by fetch_all
+_KINDS = (
+    ("fan", "fans"),
+    ("temp", "temperatures"),
+    ("psu", "psus"),
+    ("volt", "voltages"),
+)
+
+
+def _num(v):
+    """Coerce a Redfish reading to int/float, or None if it isn't numeric."""
+    if v is None or v == "" or v == "N/A":
+        return None
+    if isinstance(v, (int, float)):
+        return v
+    if isinstance(v, str):
+        try:
+            return int(v)
+        except ValueError:
+            try:
+                return float(v)
+            except ValueError:
+                return None
+    return None
 
 
-class _LegacyTLSAdapter(HTTPAdapter):
-    """Allow legacy TLS and weaker ciphers for older CIMC builds."""
+def _member_id(mid):
+    """Return MemberID as an int where possible, else unchanged."""
+    if mid is None or isinstance(mid, int):
+        return mid
+    try:
+        return int(mid)
+    except (TypeError, ValueError):
+        return _intern(mid)
 
-    def __init__(self, verify_ssl: bool, tls_min: str, *args, **kwargs)->None:
-        # Set fields BEFORE calling super().__init__(), because that calls init_poolmanager().
-        self._verify_ssl = verify_ssl
-        self._tls_min = tls_min
-        super().__init__(*args, **kwargs)
 
-    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
-        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-        ctx.minimum_version = {
-            "1.0": ssl.TLSVersion.TLSv1,
-            "1.1": ssl.TLSVersion.TLSv1_1,
-            "1.2": ssl.TLSVersion.TLSv1_2,
-        }.get(self._tls_min, ssl.TLSVersion.TLSv1)
+def _intern(v):
+    """Intern identifier strings that repeat across rows, polls and entities."""
+    return sys.intern(v) if isinstance(v, str) else v
 
 
+def _thresholds(obj: dict[str, Any]) -> dict[str, Any]:
+    return {dest: _num(obj.get(src)) for dest, src in _THRESH_KEYS}
 
-        # Relax OpenSSL 3 defaults for legacy servers
-        with suppress(ssl.SSLError, ValueError):  # some builds raise ValueError here
-            ctx.set_ciphers("DEFAULT:@SECLEVEL=1")
 
-        flag = getattr(ssl, "OP_LEGACY_SERVER_CONNECT", 0)
-        if flag:
-            ctx.options |= flag
+@functools.lru_cache(maxsize=8)
+def _build_ssl_context(verify_ssl: bool, tls_min: str) -> ssl.SSLContext:
+    """Allow legacy TLS and weaker ciphers for older CIMC builds.
 
-        if not self._verify_ssl:
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
+    Cached per (verify_ssl, tls_min) so session re-creation and config-flow
+    validation reuse the same context instead of redoing the OpenSSL setup.
+    Loading the CA bundle is blocking I/O; call via `async_get_ssl_context`.
+    """
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ctx.minimum_version = {
+        "1.0": ssl.TLSVersion.TLSv1,
+        "1.1": ssl.TLSVersion.TLSv1_1,
+        "1.2": ssl.TLSVersion.TLSv1_2,
+    }.get(tls_min, ssl.TLSVersion.TLSv1)
 
+    # Relax OpenSSL 3 defaults for legacy servers
+    with suppress(ssl.SSLError, ValueError):  # some builds raise ValueError here
+        ctx.set_ciphers("DEFAULT:@SECLEVEL=1")
 
-        pool_kwargs["ssl_context"] = ctx
-        return super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+    flag = getattr(ssl, "OP_LEGACY_SERVER_CONNECT", 0)
+    if flag:
+        ctx.options |= flag
 
-class CimcRedfishClient:
-    """Very small Redfish client, synchronous (used via executor)."""
+    if verify_ssl:
+        # Same CA bundle requests used
+        ctx.load_verify_locations(cafile=certifi.where())
+    else:
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+
+    return ctx
+
+
+async def async_get_ssl_context(
+    hass: HomeAssistant, verify_ssl: bool, tls_min: str
+) -> ssl.SSLContext:
+    """Build (or reuse) the legacy-TLS context off the event loop."""
+    return await hass.async_add_executor_job(_build_ssl_context, verify_ssl, tls_min)
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create a keep-alive session suitable for sharing across CIMC hosts.
 
-    def __init__(self, host: str, username: str, password: str, verify_ssl: bool, tls_min: str) -> None:
-        """Initialize client with endpoint, credentials, and TLS/verify options."""
+    TLS settings and credentials differ per host, so they are passed on each
+    request rather than baked into the connector.
+    """
+    # A handful of GETs per host per poll: keep those TLS sockets alive
+    # across polls instead of re-handshaking every interval.
+    connector = aiohttp.TCPConnector(
+        limit_per_host=4,
+        keepalive_timeout=DEFAULT_SCAN_INTERVAL + 15,
+        force_close=False,
+    )
+    return aiohttp.ClientSession(connector=connector, headers=_HEADERS)
+
+
+class CimcRedfishClient:
+    """Very small Redfish client, asyncio-native (aiohttp)."""
+
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str,
+        ssl_context: ssl.SSLContext,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
+        """Initialize client with endpoint, credentials, and TLS context.
+
+        `ssl_context` comes from `async_get_ssl_context`, so no certificate
+        loading happens on the event loop.
+
+        If `session` is given it is borrowed and never closed by the client;
+        otherwise the client creates (and owns) its own session on first use.
+        """
         self.base = f"https://{host}"
-        self.auth = (username, password)
-        self.verify = verify_ssl
-        self.tls_min = tls_min
-        self._session: requests.Session | None = None
+        self.auth = aiohttp.BasicAuth(username, password)
+        self._ssl = ssl_context
+        self._session = session
+        self._owns_session = session is None
         self._chassis_path: str | None = None
+        self._device_info: dict[str, Any] | None = None
+        # url -> (ETag, Last-Modified, parsed body) for conditional GETs
+        self._cache: dict[str, tuple[str | None, str | None, Any]] = {}
         self._host = host
 
-        if not self.verify:
-            # Hide “Unverified HTTPS request …” only for this process
-            urllib3.disable_warnings(InsecureRequestWarning)
-
-    def _session_obj(self) -> requests.Session:
-        if self._session is None:
-            s = requests.Session()
-            s.mount("https://", _LegacyTLSAdapter(self.verify, self.tls_min))
-            self._session = s
+    def _session_obj(self) -> aiohttp.ClientSession:
+        if self._owns_session and (self._session is None or self._session.closed):
+            self._session = create_session()
         return self._session
 
-    def _pick_chassis(self) -> str:
+    async def async_close(self) -> None:
+        """Close the underlying HTTP session, if this client owns it."""
+        if not self._owns_session:
+            return
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def async_setup(self) -> None:
+        """Discover the chassis and cache its device info.
+
+        The chassis path and manufacturer/model/serial are stable for the life
+        of the CIMC, so they are fetched once here instead of on every poll.
+        """
+        self._chassis_path = await self._pick_chassis()
+        self._device_info = await self._fetch_device(self._chassis_path)
+
+    async def _ensure_setup(self) -> None:
+        # Standalone fetch_* callers (e.g. config-flow validation) may not
+        # have run async_setup().
+        if self._device_info is None:
+            await self.async_setup()
+
+    async def _get_json(self, url: str) -> Any:
         s = self._session_obj()
-        r = s.get(f"{self.base}/redfish/v1/Chassis", auth=self.auth, verify=self.verify, timeout=10)
-        r.raise_for_status()
-        members = r.json().get("Members") or []
+        async with s.get(url, ssl=self._ssl, auth=self.auth, timeout=_TIMEOUT) as r:
+            r.raise_for_status()
+            return orjson.loads(await r.read())
+
+    async def _get_json_cached(self, url: str) -> Any:
+        """GET with If-None-Match/If-Modified-Since, reusing the body on 304."""
+        etag, last_mod, cached = self._cache.get(url, (None, None, None))
+        headers = {}
+        if cached is not None:
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_mod:
+                headers["If-Modified-Since"] = last_mod
+
+        s = self._session_obj()
+        async with s.get(
+            url, headers=headers, ssl=self._ssl, auth=self.auth, timeout=_TIMEOUT
+        ) as r:
+            if r.status == 304 and cached is not None:
+                return cached
+            r.raise_for_status()
+            data = orjson.loads(await r.read())
+            etag = r.headers.get("ETag")
+            last_mod = r.headers.get("Last-Modified")
+
+        if etag or last_mod:
+            self._cache[url] = (etag, last_mod, data)
+        else:
+            self._cache.pop(url, None)
+        return data
+
+    async def _pick_chassis(self) -> str:
+        data = await self._get_json(f"{self.base}/redfish/v1/Chassis")
+        members = data.get("Members") or []
         if not members:
             raise RuntimeError("No Redfish chassis members found.")
         return members[0]["@odata.id"]  # e.g. "/redfish/v1/Chassis/1"
 
-    def _ensure_chassis(self) -> str:
+    async def _ensure_chassis(self) -> str:
         if not self._chassis_path:
-            self._chassis_path = self._pick_chassis()
+            self._chassis_path = await self._pick_chassis()
         return self._chassis_path
 
-    def _fetch_if_link(self, item: Any) -> dict[str, Any]:
-        # If Thermal.Fans contains links (dicts with @odata.id only), fetch them
-        if isinstance(item, dict) and ("Reading" in item or "ReadingRPM" in item or "Status" in item):
-            return item
-        if isinstance(item, dict):
-            oid = item.get("@odata.id")
-            if oid:
-                s = self._session_obj()
-                r = s.get(f"{self.base}{oid}", auth=self.auth, verify=self.verify, timeout=10)
-                r.raise_for_status()
-                return r.json()
-        return item if isinstance(item, dict) else {}
-
-    @staticmethod
-    def _num(v):
-        if v in (None, "", "N/A"):
-            return None
+    async def _resolve_links(self, raw: list[Any]) -> list[dict[str, Any]]:
+        # CIMC inlines Thermal members; only bare @odata.id links need a GET,
+        # and those (rare) lookups are issued concurrently.
+        items = [it for it in raw if isinstance(it, dict)]
+        needs_fetch = [
+            i
+            for i, it in enumerate(items)
+            if "Reading" not in it
+            and "ReadingRPM" not in it
+            and "Status" not in it
+            and it.get("@odata.id")
+        ]
+        if needs_fetch:
+            fetched = await asyncio.gather(
+                *(self._get_json_cached(f"{self.base}{items[i]['@odata.id']}") for i in needs_fetch)
+            )
+            for i, obj in zip(needs_fetch, fetched):
+                items[i] = obj
+        return items
+
+    async def _get_chassis_json(self, suffix: str) -> Any:
+        chassis_path = await self._ensure_chassis()
         try:
-            return int(v)
-        except (ValueError, TypeError):
-            try:
-                return float(v)
-            except (ValueError, TypeError):
-                return None
-
-    def fetch_temperatures(self) -> list[dict[str, Any]]:
+            return await self._get_json_cached(f"{self.base}{chassis_path}{suffix}")
+        except aiohttp.ClientResponseError as e:
+            if e.status != 404:
+                raise
+        # Cached chassis path went stale; drop its conditional-GET entries,
+        # rediscover it and retry once. A concurrent request may already have.
+        stale = f"{self.base}{chassis_path}"
+        for url in [u for u in self._cache if u == stale or u.startswith(f"{stale}/")]:
+            del self._cache[url]
+        if self._chassis_path == chassis_path:
+            self._chassis_path = None
+        chassis_path = await self._ensure_chassis()
+        return await self._get_json_cached(f"{self.base}{chassis_path}{suffix}")
+
+    async def _get_thermal(self) -> dict[str, Any]:
+        return await self._get_chassis_json("/Thermal") or {}
+
+    async def fetch_temperatures(self) -> list[dict[str, Any]]:
         """Return temperature sensors."""
-        chassis_path = self._ensure_chassis()
-        s = self._session_obj()
-
-        r = s.get(f"{self.base}{chassis_path}/Thermal", auth=self.auth, verify=self.verify, timeout=10)
-        r.raise_for_status()
-        thermal = r.json()
+        await self._ensure_setup()
+        thermal = await self._get_thermal()
+        return await self._parse_temps(thermal)
 
+    async def _parse_temps(self, thermal: dict[str, Any]) -> list[dict[str, Any]]:
         temps_raw = thermal.get("Temperatures") or []
-        temps_objs = [self._fetch_if_link(it) for it in temps_raw]
+        temps_objs = await self._resolve_links(temps_raw)
 
         temps: list[dict[str, Any]] = []
         for t in temps_objs:
             status = t.get("Status") or {}
-            mid = t.get("MemberID")
-            try:
-                member_id = int(mid) if mid is not None else None
-            except (TypeError, ValueError):
-                member_id = mid
+            member_id = _member_id(t.get("MemberID"))
 
             temps.append({
-                "name": t.get("Name") or f"Temp {member_id}",
-                "context": t.get("PhysicalContext"),
+                "name": _intern(t.get("Name") or f"Temp {member_id}"),
+                "context": _intern(t.get("PhysicalContext")),
                 "member_id": member_id,
-                "celsius": self._num(t.get("ReadingCelsius")),
+                "celsius": _num(t.get("ReadingCelsius")),
                 "state": status.get("State"),
                 "health": status.get("Health"),
-                "lower_noncrit": self._num(t.get("LowerThresholdNonCritical")),
-                "lower_crit": self._num(t.get("LowerThresholdCritical")),
-                "upper_noncrit": self._num(t.get("UpperThresholdNonCritical")),
-                "upper_crit": self._num(t.get("UpperThresholdCritical")),
-                "sensor_number": self._num(t.get("SensorNumber")),
-                "odata_id": t.get("@odata.id"),
+                **_thresholds(t),
+                "sensor_number": _num(t.get("SensorNumber")),
+                "odata_id": _intern(t.get("@odata.id")),
             })
         return temps
 
 
     # coordinator.py — inside CimcRedfishClient
-    def fetch_power(self) -> dict[str, Any]:
+    async def fetch_power(self) -> dict[str, Any]:
         """Return overall power, PSUs (power+voltage), and voltage rails."""
-        chassis_path = self._ensure_chassis()
-        s = self._session_obj()
-        r = s.get(f"{self.base}{chassis_path}/Power", auth=self.auth, verify=self.verify, timeout=10)
-        r.raise_for_status()
-        pw = r.json() or {}
+        await self._ensure_setup()
+        return await self._fetch_power()
+
+    async def _fetch_power(self) -> dict[str, Any]:
+        pw = await self._get_chassis_json("/Power") or {}
 
         # Overall power + metrics
         pc = pw.get("PowerControl") or {}
-        consumed = self._num(pc.get("PowerConsumedWatts"))
+        consumed = _num(pc.get("PowerConsumedWatts"))
         pm = pc.get("PowerMetric") or {}
         power = {
-            "consumed_watts": self._num(consumed),
-            "min_watts": self._num(pm.get("MinConsumedWatts")),
-            "avg_watts": self._num(pm.get("AverageConsumedWatts")),
-            "max_watts": self._num(pm.get("MaxConsumedWatts")),
-            "interval_min": self._num(pm.get("IntervalInMin")),
+            "consumed_watts": _num(consumed),
+            "min_watts": _num(pm.get("MinConsumedWatts")),
+            "avg_watts": _num(pm.get("AverageConsumedWatts")),
+            "max_watts": _num(pm.get("MaxConsumedWatts")),
+            "interval_min": _num(pm.get("IntervalInMin")),
         }
 
         # Voltages rails
@@ -179,24 +341,17 @@ class CimcRedfishClient:
         rails: list[dict[str, Any]] = []
         for v in rails_raw:
             status = v.get("Status") or {}
-            mid = v.get("MemberID")
-            try:
-                member_id = int(mid) if mid is not None else None
-            except (TypeError, ValueError):
-                member_id = mid
+            member_id = _member_id(v.get("MemberID"))
             rails.append({
                 "member_id": member_id,
-                "name": v.get("Name"),
-                "context": v.get("PhysicalContext"),
-                "volts": self._num(v.get("ReadingVolts")),
-                "lower_noncrit": self._num(v.get("LowerThresholdNonCritical")),
-                "lower_crit": self._num(v.get("LowerThresholdCritical")),
-                "upper_noncrit": self._num(v.get("UpperThresholdNonCritical")),
-                "upper_crit": self._num(v.get("UpperThresholdCritical")),
+                "name": _intern(v.get("Name")),
+                "context": _intern(v.get("PhysicalContext")),
+                "volts": _num(v.get("ReadingVolts")),
+                **_thresholds(v),
                 "state": status.get("State") or status.get("state"),
                 "health": status.get("Health") or status.get("health"),
-                "sensor_number": self._num(v.get("SensorNumber")),
-                "odata_id": v.get("@odata.id"),
+                "sensor_number": _num(v.get("SensorNumber")),
+                "odata_id": _intern(v.get("@odata.id")),
             })
 
         # PSUs + stitch matched rail voltage by MemberID where PhysicalContext == PowerSupply
@@ -204,115 +359,124 @@ class CimcRedfishClient:
         rails_by_mid = {str(r["member_id"]): r for r in rails if r.get("context") == "PowerSupply" and r.get("member_id") is not None}
         psus: list[dict[str, Any]] = []
         for psu in psus_raw:
-            mid = psu.get("MemberID")
-            try:
-                member_id = int(mid) if mid is not None else None
-            except (TypeError, ValueError):
-                member_id = mid
+            member_id = _member_id(psu.get("MemberID"))
             status = psu.get("Status") or {}
             rail = rails_by_mid.get(str(member_id), {})
             psus.append({
                 "member_id": member_id,
-                "name": psu.get("Name") or f"PSU {member_id}",
+                "name": _intern(psu.get("Name") or f"PSU {member_id}"),
                 "state": (status.get("State") or status.get("state")),
-                "last_power": self._num(psu.get("LastPowerOutputWatts")),
-                "line_input_volts": self._num(psu.get("LineInputVoltage")),
+                "last_power": _num(psu.get("LastPowerOutputWatts")),
+                "line_input_volts": _num(psu.get("LineInputVoltage")),
                 "serial": psu.get("SerialNumber"),
                 "model": psu.get("Model"),
                 "part_number": psu.get("PartNumber"),
                 "spare_part_number": psu.get("SparePartNumber"),
-                "odata_id": psu.get("@odata.id"),
+                "odata_id": _intern(psu.get("@odata.id")),
                 "voltage": rail.get("volts"),
                 "voltage_odata_id": rail.get("odata_id"),
             })
 
         return {"power": power, "psus": psus, "voltages": rails}
 
-    def fetch_all(self) -> dict[str, Any]:
+    async def fetch_all(self) -> dict[str, Any]:
         """Fetch a combined snapshot of CIMC telemetry.
 
-        Always includes fan data, and attempts to merge in power and
-        temperature data if those endpoints are available. Individual
+        Always includes fan data and the cached device info, and attempts to
+        merge in power and temperature data if those endpoints are available.
+        The Thermal and Power GETs run concurrently; individual optional
         sections are silently skipped if they raise errors.
 
         Returns:
             dict[str, Any]: Dictionary containing one or more of:
                 - "fans": list of fan telemetry
+                - "device": cached chassis device info
                 - "power": power/PSU metrics
                 - "temperatures": list of temperature sensors
+                - "by_key": every fan/temp/psu/volt row keyed by
+                  `(kind, member id or name)` for O(1) entity lookups
+                - "voltages_by_oid": voltage rails keyed by `odata_id`
         """
-        out = self.fetch_fans()
-        with suppress(Exception):
-            out.update(self.fetch_power())
+        if self._device_info is None:
+            raise UpdateFailed("CIMC client used before async_setup()")
+        thermal, power = await asyncio.gather(
+            self._get_thermal(),
+            self._fetch_power(),
+            return_exceptions=True,
+        )
+        # Thermal (fans) is mandatory; power/temperatures are best-effort
+        if isinstance(thermal, BaseException):
+            raise thermal
+
+        out: dict[str, Any] = {
+            "fans": await self._parse_fans(thermal),
+            "device": self._device_info,
+        }
+        if not isinstance(power, BaseException):
+            out.update(power)
         with suppress(Exception):
-            out["temperatures"] = self.fetch_temperatures()
+            out["temperatures"] = await self._parse_temps(thermal)
+
+        by_key: dict[tuple[str, str], dict[str, Any]] = {}
+        for kind, section in _KINDS:
+            for row in out.get(section, ()):
+                by_key[(kind, str(row.get("member_id") or row.get("name")))] = row
+        out["by_key"] = by_key
+        out["voltages_by_oid"] = {
+            r["odata_id"]: r for r in out.get("voltages", ()) if r.get("odata_id")
+        }
         return out
 
-
-
-    def fetch_fans(self) -> dict[str, Any]:
+    async def fetch_fans(self) -> dict[str, Any]:
         """Return a dict with fan list and device info."""
-        chassis_path = self._ensure_chassis()
-        s = self._session_obj()
-
-        # Fetch Thermal
-        r = s.get(f"{self.base}{chassis_path}/Thermal", auth=self.auth, verify=self.verify, timeout=10)
-        r.raise_for_status()
-        thermal = r.json()
+        await self._ensure_setup()
+        thermal = await self._get_thermal()
+        return {"fans": await self._parse_fans(thermal), "device": self._device_info}
 
+    async def _parse_fans(self, thermal: dict[str, Any]) -> list[dict[str, Any]]:
         fans_raw = thermal.get("Fans") or []
-        fans_objs = [self._fetch_if_link(it) for it in fans_raw]
+        fans_objs = await self._resolve_links(fans_raw)
 
         fans: list[dict[str, Any]] = []
         for f in fans_objs:
             status = f.get("Status") or {}
             rpm_val = f.get("Reading") or f.get("ReadingRPM")
-            rpm = self._num(rpm_val)
+            rpm = _num(rpm_val)
             if rpm is None:
                 rpm = rpm_val
 
-            mid = f.get("MemberID")
-            try:
-                member_id = int(mid) if mid is not None else None
-            except (TypeError, ValueError):
-                member_id = mid
+            member_id = _member_id(f.get("MemberID"))
 
             fans.append({
-                "name": f.get("Name") or f.get("FanName") or "Fan",
-                "context": f.get("PhysicalContext"),
+                "name": _intern(f.get("Name") or f.get("FanName") or "Fan"),
+                "context": _intern(f.get("PhysicalContext")),
                 "member_id": member_id,
                 "rpm": rpm,
                 "units": f.get("ReadingUnits") or ("RPM" if f.get("ReadingRPM") is not None else ""),
                 "state": status.get("State"),
                 "health": status.get("Health"),
-                "lower_noncrit": self._num(f.get("LowerThresholdNonCritical")),
-                "lower_crit": self._num(f.get("LowerThresholdCritical")),
-                "upper_noncrit": self._num(f.get("UpperThresholdNonCritical")),
-                "upper_crit": self._num(f.get("UpperThresholdCritical")),
-                "odata_id": f.get("@odata.id"),
+                **_thresholds(f),
+                "odata_id": _intern(f.get("@odata.id")),
             })
+        return fans
 
+    async def _fetch_device(self, chassis_path: str) -> dict[str, Any]:
         # Try to grab some basic device info from chassis
         try:
-            rc = s.get(f"{self.base}{chassis_path}", auth=self.auth, verify=self.verify, timeout=10)
-            rc.raise_for_status()
-            chassis = rc.json()
+            chassis = await self._get_json(f"{self.base}{chassis_path}")
             vendor = chassis.get("Manufacturer") or "Cisco"
             model = chassis.get("Model") or "C-Series"
             serial = chassis.get("SerialNumber")
-        except (requests.RequestException, ValueError, KeyError, TypeError):
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, KeyError, TypeError):
             # Narrow exceptions instead of a blind 'except Exception'
             vendor = "Cisco"
             model = "C-Series"
             serial = None
 
         return {
-            "fans": fans,
-            "device": {
-                "host": self._host,
-                "manufacturer": vendor,
-                "model": model,
-                "serial": serial,
-                "ident": f"{self._host}",
-            }
+            "host": self._host,
+            "manufacturer": vendor,
+            "model": model,
+            "serial": serial,
+            "ident": f"{self._host}",
         }
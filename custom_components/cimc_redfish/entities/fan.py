@@ -7,10 +7,13 @@ Thermal endpoint.
 
 from __future__ import annotations
 
+import sys
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.const import REVOLUTIONS_PER_MINUTE
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -39,51 +42,55 @@ class CimcFanSensor(CoordinatorEntity, SensorEntity):
         self._host = device.get("host")
         self._device = device
         self._fan_id = str(fan.get("member_id") or fan.get("name"))
+        self._key = ("fan", self._fan_id)
         self._odata = fan.get("odata_id")
         base_name = normalize_name(fan.get("name") or f"Fan {self._fan_id}")
         self._attr_name = f"CIMC {self._host} {base_name}"
         # unique: host + odata id (if available) + member id fallback
         unique = f"{self._host}:{self._odata or self._fan_id}"
-        self._attr_unique_id = unique.replace("/", "_")
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the parent device information for registry grouping."""
-        ident = (DOMAIN, self._device.get("ident") or self._host)
-        return DeviceInfo(
-            identifiers={ident},
+        self._attr_unique_id = sys.intern(unique.replace("/", "_"))
+        # Parent device information for registry grouping
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.get("ident") or self._host)},
             name=f"CIMC {self._host}",
-            manufacturer=self._device.get("manufacturer") or "Cisco",
-            model=self._device.get("model") or "C-Series",
-            serial_number=self._device.get("serial"),
+            manufacturer=device.get("manufacturer") or "Cisco",
+            model=device.get("model") or "C-Series",
+            serial_number=device.get("serial"),
         )
+        # Identity and thresholds don't change between polls; build them once
+        self._static_attrs = MappingProxyType({
+            "name": fan.get("name"),
+            "context": fan.get("context"),
+            "lower_noncrit": fan.get("lower_noncrit"),
+            "lower_crit": fan.get("lower_crit"),
+            "upper_noncrit": fan.get("upper_noncrit"),
+            "upper_crit": fan.get("upper_crit"),
+            "odata_id": fan.get("odata_id"),
+        })
+        self._update_snapshot()
+
+    def _update_snapshot(self) -> None:
+        self._row: dict[str, Any] | None = self.coordinator.data["by_key"].get(self._key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Capture this sensor's row once per coordinator update."""
+        self._update_snapshot()
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> int | float | None:
         """Return the current RPM for this fan, or None if unavailable."""
-        fans = self.coordinator.data.get("fans", []) or []
-        for f in fans:
-            fid = str(f.get("member_id") or f.get("name"))
-            if fid == self._fan_id:
-                return f.get("rpm")
-        return None
+        return self._row.get("rpm") if self._row else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional telemetry and thresholds for this fan."""
-        fans = self.coordinator.data.get("fans", []) or []
-        for f in fans:
-            fid = str(f.get("member_id") or f.get("name"))
-            if fid == self._fan_id:
-                return {
-                    "name": f.get("name"),
-                    "state": f.get("state"),
-                    "health": f.get("health"),
-                    "context": f.get("context"),
-                    "lower_noncrit": f.get("lower_noncrit"),
-                    "lower_crit": f.get("lower_crit"),
-                    "upper_noncrit": f.get("upper_noncrit"),
-                    "upper_crit": f.get("upper_crit"),
-                    "odata_id": f.get("odata_id"),
-                }
-        return {}
+        """Return static thresholds plus the current state/health for this fan."""
+        f = self._row
+        if not f:
+            return {}
+        return {
+            **self._static_attrs,
+            "state": f.get("state"),
+            "health": f.get("health"),
+        }
@@ -7,6 +7,8 @@ from the Redfish Power and Voltages resources.
 
 from __future__ import annotations
 
+import sys
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -15,6 +17,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import UnitOfElectricPotential, UnitOfPower
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -28,27 +31,37 @@ def _psu_base(device: dict[str, Any], psu: dict[str, Any]) -> tuple[str, str, st
     host = device.get("host")
     name = psu.get("name") or f"PSU {psu.get('member_id')}"
     uid_base = (psu.get("odata_id") or f"psu:{psu.get('member_id') or name}").replace("/", "_")
-    return host, name, uid_base
+    return host, name, sys.intern(uid_base)
 
 
 class _CimcPsuBase(CoordinatorEntity, SensorEntity):
-    """Shared DeviceInfo for PSU sensors."""
+    """Shared DeviceInfo and per-update PSU snapshot for PSU sensors."""
 
-    def __init__(self, coordinator, device: dict[str, Any]) -> None:
+    def __init__(self, coordinator, device: dict[str, Any], psu: dict[str, Any]) -> None:
         super().__init__(coordinator)
         self._device = device
         self._host = device.get("host")
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        ident = (DOMAIN, self._device.get("ident") or self._host)
-        return DeviceInfo(
-            identifiers={ident},
+        self._id = str(psu.get("member_id") or psu.get("name"))
+        self._key = ("psu", self._id)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.get("ident") or self._host)},
             name=f"CIMC {self._host}",
-            manufacturer=self._device.get("manufacturer") or "Cisco",
-            model=self._device.get("model") or "C-Series",
-            serial_number=self._device.get("serial"),
+            manufacturer=device.get("manufacturer") or "Cisco",
+            model=device.get("model") or "C-Series",
+            serial_number=device.get("serial"),
         )
+        self._update_snapshot()
+
+    def _update_snapshot(self) -> None:
+        data = self.coordinator.data
+        self._row: dict[str, Any] | None = data["by_key"].get(self._key)
+        self._power: dict[str, Any] = data.get("power") or {}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Capture this PSU's row once per coordinator update."""
+        self._update_snapshot()
+        super()._handle_coordinator_update()
 
 
 class CimcPsuVoltageSensor(_CimcPsuBase):
@@ -60,54 +73,57 @@ class CimcPsuVoltageSensor(_CimcPsuBase):
 
     def __init__(self, coordinator, entry_id: str, device: dict[str, Any], psu: dict[str, Any]) -> None:
         """Initialize the voltage sensor from the PSU descriptor."""
-        super().__init__(coordinator, device)
-        self._id = str(psu.get("member_id") or psu.get("name"))
+        super().__init__(coordinator, device, psu)
         host, name, uid = _psu_base(device, psu)
         name = normalize_name(name)
         self._attr_name = f"{name} Voltage"
-        self._attr_unique_id = f"{host}:{uid}:voltage"
+        self._attr_unique_id = sys.intern(f"{host}:{uid}:voltage")
+        self._static_attrs = MappingProxyType({
+            "psu_odata_id": psu.get("odata_id"),
+            "rail_odata_id": psu.get("voltage_odata_id"),
+        })
+
+    def _update_snapshot(self) -> None:
+        super()._update_snapshot()
+        # Find the matched rail record by odata_id, else by MemberID
+        self._rail: dict[str, Any] | None = None
+        if self._row:
+            data = self.coordinator.data
+            self._rail = data["voltages_by_oid"].get(self._row.get("voltage_odata_id"))
+            if self._rail is None:
+                self._rail = data["by_key"].get(("volt", str(self._row.get("member_id"))))
 
     @property
     def native_value(self):
         """Return the current PSU output voltage (V), if available."""
-        for p in self.coordinator.data.get("psus", []) or []:
-            if str(p.get("member_id") or p.get("name")) == self._id:
-                return p.get("voltage")
-        return None
+        return self._row.get("voltage") if self._row else None
 
     @property
     def extra_state_attributes(self):
         """Return stitched attributes from PSU and matching rail thresholds."""
-        for p in self.coordinator.data.get("psus", []) or []:
-            if str(p.get("member_id") or p.get("name")) == self._id:
-                # Find the matched rail record by odata_id, if present
-                rail_oid = p.get("voltage_odata_id")
-                rail = None
-                for r in self.coordinator.data.get("voltages", []) or []:
-                    if r.get("odata_id") == rail_oid or str(r.get("member_id")) == str(p.get("member_id")):
-                        rail = r
-                        break
-
-                attrs = {
-                    "state": p.get("state"),
-                    "serial": p.get("serial"),
-                    "model": p.get("model"),
-                    "psu_odata_id": p.get("odata_id"),
-                    "rail_odata_id": p.get("voltage_odata_id"),
-                    "line_input_volts": p.get("line_input_volts"),
-                }
-                if rail:
-                    attrs.update({
-                        "context": rail.get("context"),
-                        "sensor_number": rail.get("sensor_number"),
-                        "lower_noncrit": rail.get("lower_noncrit"),
-                        "lower_crit": rail.get("lower_crit"),
-                        "upper_noncrit": rail.get("upper_noncrit"),
-                        "upper_crit": rail.get("upper_crit"),
-                        "rail_name": rail.get("name"),
-                    })
-                return attrs
-        return {}
+        p = self._row
+        if not p:
+            return {}
+        rail = self._rail
+
+        attrs = {
+            **self._static_attrs,
+            "state": p.get("state"),
+            "serial": p.get("serial"),
+            "model": p.get("model"),
+            "line_input_volts": p.get("line_input_volts"),
+        }
+        if rail:
+            attrs.update({
+                "context": rail.get("context"),
+                "sensor_number": rail.get("sensor_number"),
+                "lower_noncrit": rail.get("lower_noncrit"),
+                "lower_crit": rail.get("lower_crit"),
+                "upper_noncrit": rail.get("upper_noncrit"),
+                "upper_crit": rail.get("upper_crit"),
+                "rail_name": rail.get("name"),
+            })
+        return attrs
 
 
 class CimcPsuPowerSensor(_CimcPsuBase):
@@ -119,39 +135,36 @@ class CimcPsuPowerSensor(_CimcPsuBase):
 
     def __init__(self, coordinator, entry_id: str, device: dict[str, Any], psu: dict[str, Any]) -> None:
         """Initialize the power sensor from the PSU descriptor."""
-        super().__init__(coordinator, device)
-        self._id = str(psu.get("member_id") or psu.get("name"))
+        super().__init__(coordinator, device, psu)
         host, name, uid = _psu_base(device, psu)
         name = normalize_name(name)
         self._attr_name = f"{name} Power"
-        self._attr_unique_id = f"{host}:{uid}:power"
+        self._attr_unique_id = sys.intern(f"{host}:{uid}:power")
+        self._static_attrs = MappingProxyType({"psu_odata_id": psu.get("odata_id")})
 
     @property
     def native_value(self):
         """Return the most recent power draw in watts, if available."""
-        for p in self.coordinator.data.get("psus", []) or []:
-            if str(p.get("member_id") or p.get("name")) == self._id:
-                # From PowerSupplies[].LastPowerOutputWatts
-                return p.get("last_power")
-        return None
+        # From PowerSupplies[].LastPowerOutputWatts
+        return self._row.get("last_power") if self._row else None
 
     @property
     def extra_state_attributes(self):
         """Include overall PowerMetric (min/avg/max/interval) as convenience attributes."""
-        power = self.coordinator.data.get("power") or {}
-        for p in self.coordinator.data.get("psus", []) or []:
-            if str(p.get("member_id") or p.get("name")) == self._id:
-                return {
-                    "state": p.get("state"),
-                    "line_input_volts": p.get("line_input_volts"),
-                    "serial": p.get("serial"),
-                    "model": p.get("model"),
-                    "psu_odata_id": p.get("odata_id"),
-                    # Overall metrics from PowerControl.PowerMetric
-                    "power_consumed_watts": power.get("consumed_watts"),
-                    "power_min_watts": power.get("min_watts"),
-                    "power_avg_watts": power.get("avg_watts"),
-                    "power_max_watts": power.get("max_watts"),
-                    "power_interval_min": power.get("interval_min"),
-                }
-        return {}
+        power = self._power
+        p = self._row
+        if not p:
+            return {}
+        return {
+            **self._static_attrs,
+            "state": p.get("state"),
+            "line_input_volts": p.get("line_input_volts"),
+            "serial": p.get("serial"),
+            "model": p.get("model"),
+            # Overall metrics from PowerControl.PowerMetric
+            "power_consumed_watts": power.get("consumed_watts"),
+            "power_min_watts": power.get("min_watts"),
+            "power_avg_watts": power.get("avg_watts"),
+            "power_max_watts": power.get("max_watts"),
+            "power_interval_min": power.get("interval_min"),
+        }
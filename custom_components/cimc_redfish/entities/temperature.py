@@ -7,6 +7,8 @@ thresholds and health status.
 
 from __future__ import annotations
 
+import sys
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -15,6 +17,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import UnitOfTemperature
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -40,50 +43,55 @@ class CimcTemperatureSensor(CoordinatorEntity, SensorEntity):
         self._host = device.get("host")
         self._device = device
         self._temp_id = str(temp.get("member_id") or temp.get("name"))
+        self._key = ("temp", self._temp_id)
         self._odata = temp.get("odata_id")
         base_name = normalize_name(temp.get("name") or f"Temperature {self._temp_id}")
         self._attr_name = f"CIMC {self._host} {base_name}"
         unique = f"{self._host}:{self._odata or self._temp_id}"
-        self._attr_unique_id = unique.replace("/", "_")
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information to group this entity."""
-
-        ident = (DOMAIN, self._device.get("ident") or self._host)
-        return DeviceInfo(
-            identifiers={ident},
+        self._attr_unique_id = sys.intern(unique.replace("/", "_"))
+        # Device registry information to group this entity
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.get("ident") or self._host)},
             name=f"CIMC {self._host}",
-            manufacturer=self._device.get("manufacturer") or "Cisco",
-            model=self._device.get("model") or "C-Series",
-            serial_number=self._device.get("serial"),
+            manufacturer=device.get("manufacturer") or "Cisco",
+            model=device.get("model") or "C-Series",
+            serial_number=device.get("serial"),
         )
+        # Identity and thresholds don't change between polls; build them once
+        self._static_attrs = MappingProxyType({
+            "name": temp.get("name"),
+            "context": temp.get("context"),
+            "lower_noncrit": temp.get("lower_noncrit"),
+            "lower_crit": temp.get("lower_crit"),
+            "upper_noncrit": temp.get("upper_noncrit"),
+            "upper_crit": temp.get("upper_crit"),
+            "sensor_number": temp.get("sensor_number"),
+            "odata_id": temp.get("odata_id"),
+        })
+        self._update_snapshot()
+
+    def _update_snapshot(self) -> None:
+        self._row: dict[str, Any] | None = self.coordinator.data["by_key"].get(self._key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Capture this sensor's row once per coordinator update."""
+        self._update_snapshot()
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> int | float | None:
         """Return the most recent temperature in celsius, if available."""
-        for t in self.coordinator.data.get("temperatures", []) or []:
-            tid = str(t.get("member_id") or t.get("name"))
-            if tid == self._temp_id:
-                return t.get("celsius")
-        return None
+        return self._row.get("celsius") if self._row else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Includes all other data as attributes."""
-        for t in self.coordinator.data.get("temperatures", []) or []:
-            tid = str(t.get("member_id") or t.get("name"))
-            if tid == self._temp_id:
-                return {
-                    "name": t.get("name"),
-                    "state": t.get("state"),
-                    "health": t.get("health"),
-                    "context": t.get("context"),
-                    "lower_noncrit": t.get("lower_noncrit"),
-                    "lower_crit": t.get("lower_crit"),
-                    "upper_noncrit": t.get("upper_noncrit"),
-                    "upper_crit": t.get("upper_crit"),
-                    "sensor_number": t.get("sensor_number"),
-                    "odata_id": t.get("odata_id"),
-                }
-        return {}
+        t = self._row
+        if not t:
+            return {}
+        return {
+            **self._static_attrs,
+            "state": t.get("state"),
+            "health": t.get("health"),
+        }
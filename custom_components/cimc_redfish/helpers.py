@@ -9,9 +9,50 @@ common abbreviations (e.g., FAN1 → "Fan 1", PSU2_TEMP → "PSU 2 Temperature")
 removing redundant tokens, and replacing underscores with spaces.
 """
 
+from functools import lru_cache
 import re
 
-
+# Upper-cased token -> display text ("" drops the token)
+_MAP = {
+    "TACH": "Tach",
+    "TEMP": "Temperature",
+    "TMP": "Temperature",
+    "FP": "Front Panel",
+    "PCH": "Chipset",
+    "INLET": "Inlet",
+    "OUTLET": "Outlet",
+    "OUTLETTMP": "Outlet Temperature",
+    "TEMPSENS": "Temperature",
+    "SENSOR": "",
+    "SENS": "",
+}
+
+# Numbered tokens: FAN1 -> "Fan 1", RISER2 -> "Riser 2", TEMP1 -> "Temperature 1"
+_NUMBERED = {
+    "FAN": "Fan",
+    "RISER": "Riser",
+    "PSU": "PSU",
+    "TACH": "Tach",
+    "TEMP": "Temperature",
+    "TMP": "Temperature",
+}
+_NUMBERED_RE = re.compile(r"([A-Z]+)(\d+)")
+
+# Raw names are split on underscores and on whitespace
+_SPLIT_RE = re.compile(r"[_\s]+")
+
+
+def _map_token(tok: str) -> str:
+    upper = tok.upper()
+    if upper in _MAP:
+        return _MAP[upper]
+    m = _NUMBERED_RE.fullmatch(upper)
+    if m and m.group(1) in _NUMBERED:
+        return f"{_NUMBERED[m.group(1)]} {m.group(2)}"
+    return tok
+
+
+@lru_cache(maxsize=512)
 def normalize_name(raw: str | None) -> str:
     """Normalize and humanize CIMC hardware identifiers into a display-friendly name.
 
@@ -30,6 +71,14 @@ def normalize_name(raw: str | None) -> str:
       * `OUTLETTMP` → `"Outlet Temperature"`, etc.
     - Removing redundant tokens like `"SENSOR"` and `"SENS"`.
 
+    Abbreviations are matched per token (split on `_` and whitespace), not as
+    arbitrary substrings, so unknown compounds are left as-is.
+
+    Examples:
+        `"FAN1_TACH1"` → `"Fan 1 Tach 1"`, `"MB_TEMP1"` → `"MB Temperature 1"`,
+        `"TEMPSENS"` → `"Temperature"`, `"P1 TEMP SENS"` → `"P1 Temperature"`,
+        `"RISER2_OUTLETTMP"` → `"Riser 2 Outlet Temperature"`.
+
     Args:
         raw: The raw CIMC identifier string, or None.
 
@@ -39,26 +88,4 @@ def normalize_name(raw: str | None) -> str:
     if not raw:
         return ""
 
-    name = raw
-
-    name = re.sub(r"FAN(\d+)", r"Fan \1", name, flags=re.IGNORECASE)
-    name = re.sub(r"RISER(\d+)", r"Riser \1", name, flags=re.IGNORECASE)
-    name = re.sub(r"PSU(\d+)", r"PSU \1", name, flags=re.IGNORECASE)
-
-    name = name.replace("_", " ")
-
-    name = name.replace("OUTLETTMP", "Outlet Temperature")
-
-    name = name.replace("OUTLET", "Outlet")
-    name = name.replace("TACH", " Tach ")
-    name = name.replace("FP", "Front Panel")
-    name = name.replace("TEMP", "Temperature")
-    name = name.replace("TMP", "Temperature")
-    name = name.replace("INLET", "Inlet")
-    name = name.replace("OUTLET", "Outlet")
-    name = name.replace("PCH", "Chipset")
-
-    name = name.replace("SENSOR", "")
-    name = name.replace("SENS", "")
-
-    return name.strip()
+    return " ".join(t for tok in _SPLIT_RE.split(raw) if (t := _map_token(tok)))
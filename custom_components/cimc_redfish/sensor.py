@@ -34,39 +34,33 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up sensors from the integration’s coordinator data."""
-    data = hass.data[DOMAIN][entry.entry_id]
-    coordinator = data["coordinator"]
-    device: dict[str, Any] = coordinator.data.get("device", {}) or {}
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    data_map = coordinator.data or {}
+    if not data_map:
+        # Nothing fetched yet; no entities to describe
+        return
+    device: dict[str, Any] = data_map.get("device") or {}
 
     entities: list[SensorEntity] = []
 
     # Fans
-    fans = [
+    entities.extend(
         CimcFanSensor(coordinator, entry.entry_id, device, f)
-        for f in (coordinator.data.get("fans") or [])
-    ]
+        for f in data_map.get("fans", ())
+    )
 
     # PSUs (voltage + power if present)
-    psus = [
-        sensor
-        for psu in (coordinator.data.get("psus") or [])
-        for sensor in (
-            [CimcPsuVoltageSensor(coordinator, entry.entry_id, device, psu)]
-            if psu.get("voltage") is not None
-            else []
-        ) + (
-            [CimcPsuPowerSensor(coordinator, entry.entry_id, device, psu)]
-            if psu.get("last_power") is not None
-            else []
-        )
-    ]
+    for psu in data_map.get("psus", ()):
+        if psu.get("voltage") is not None:
+            entities.append(CimcPsuVoltageSensor(coordinator, entry.entry_id, device, psu))
+        if psu.get("last_power") is not None:
+            entities.append(CimcPsuPowerSensor(coordinator, entry.entry_id, device, psu))
 
     # Temperatures
-    temps = [
+    entities.extend(
         CimcTemperatureSensor(coordinator, entry.entry_id, device, t)
-        for t in (coordinator.data.get("temperatures") or [])
-    ]
+        for t in data_map.get("temperatures", ())
+    )
 
-    entities: list[SensorEntity] = fans + psus + temps
     if entities:
         async_add_entities(entities)